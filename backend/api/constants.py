@@ -1,4 +1,6 @@
 DEFAULT_PAGE_SIZE_QUERY_PARAM = 'limit'
-MAX_PAGE_SIZE = 6
+MAX_PAGE_SIZE = 50
 MIN_INGREDIENT_AMOUNT = 1
 MAX_INGREDIENT_AMOUNT = 32000
+MAX_IMAGE_UPLOAD_SIZE = 10 * 1024 * 1024
+REFERENCE_CACHE_TIMEOUT = 60 * 15
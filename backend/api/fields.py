@@ -1,16 +1,34 @@
-import base64
+import binascii
+import re
 
 from django.core.files.base import ContentFile
 from rest_framework import serializers
 
+from api.constants import MAX_IMAGE_UPLOAD_SIZE
+
+DATA_URI_PATTERN = re.compile(
+    r'^data:image/(?P<ext>png|jpe?g|gif|webp|bmp);base64,'
+)
+
 
 class Base64ImageField(serializers.ImageField):
     """Custom serializer field for handling base64 encoded images."""
 
     def to_internal_value(self, data: str) -> ContentFile:
         """Convert base64-encoded image data to ContentFile."""
-        if isinstance(data, str) and data.startswith('data:image'):
-            format_data, imgstr = data.split(';base64,')
-            ext = format_data.split('/')[-1]
-            return ContentFile(base64.b64decode(imgstr), name=f'temp.{ext}')
+        if isinstance(data, str):
+            match = DATA_URI_PATTERN.match(data)
+            if match:
+                imgstr = data[match.end():]
+                if len(imgstr) * 3 // 4 > MAX_IMAGE_UPLOAD_SIZE:
+                    raise serializers.ValidationError(
+                        'Изображение слишком большое.'
+                    )
+                try:
+                    decoded = binascii.a2b_base64(imgstr)
+                except binascii.Error:
+                    raise serializers.ValidationError(
+                        'Некорректные данные изображения.'
+                    )
+                return ContentFile(decoded, name=f'temp.{match["ext"]}')
         return super().to_internal_value(data)
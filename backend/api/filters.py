@@ -3,13 +3,17 @@
 from django.db.models import Exists, OuterRef
 from django_filters.rest_framework import FilterSet, filters
 
-from recipes.models import Ingredient, Recipe, ShoppingCart
+from recipes.models import Favorite, Ingredient, Recipe, ShoppingCart, Tag
 
 
 class RecipeFilter(FilterSet):
     """Filter for Recipe model."""
 
-    tags = filters.AllValuesMultipleFilter(field_name='tags__slug')
+    tags = filters.ModelMultipleChoiceFilter(
+        queryset=Tag.objects.all(),
+        field_name='tags__slug',
+        to_field_name='slug'
+    )
     is_favorited = filters.BooleanFilter(method='filter_is_favorited')
     is_in_shopping_cart = filters.BooleanFilter(
         method='filter_is_in_shopping_cart'
@@ -24,9 +28,15 @@ class RecipeFilter(FilterSet):
     def filter_is_favorited(self, queryset, name, value):
         """Filter queryset by favorited status."""
         user = self.request.user
-        if value and user.is_authenticated:
-            return queryset.filter(favorites__user=user)
-        return queryset
+        if not user.is_authenticated:
+            return queryset
+
+        favorite_filter = Exists(
+            Favorite.objects.filter(user=user, recipe=OuterRef('pk'))
+        )
+        if value:
+            return queryset.filter(favorite_filter)
+        return queryset.filter(~favorite_filter)
 
     def filter_is_in_shopping_cart(self, queryset, name, value):
         """Filter queryset by shopping cart status."""
@@ -35,15 +45,11 @@ class RecipeFilter(FilterSet):
             return queryset
 
         shopping_cart_filter = Exists(
-            ShoppingCart.objects.filter(
-                user=user,
-                recipe=OuterRef('pk')
-            )
+            ShoppingCart.objects.filter(user=user, recipe=OuterRef('pk'))
         )
-
         if value:
             return queryset.filter(shopping_cart_filter)
-        return queryset(shopping_cart_filter)
+        return queryset.filter(~shopping_cart_filter)
 
 
 class IngredientFilter(FilterSet):
@@ -1,6 +1,6 @@
 """Pagination module for REST framework."""
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 from api.constants import DEFAULT_PAGE_SIZE_QUERY_PARAM, MAX_PAGE_SIZE
 
@@ -10,3 +10,16 @@ class PageNumberPagination(PageNumberPagination):
 
     page_size_query_param = DEFAULT_PAGE_SIZE_QUERY_PARAM
     max_page_size = MAX_PAGE_SIZE
+
+
+class RecipeCursorPagination(CursorPagination):
+    """Keyset pagination for deep recipe feeds.
+
+    Page-number pagination costs O(offset) per request on deep pages;
+    a cursor keyed on the primary key keeps every page at O(page_size).
+    Clients that do not need numbered pages can opt in via this class.
+    """
+
+    ordering = '-id'
+    page_size_query_param = DEFAULT_PAGE_SIZE_QUERY_PARAM
+    max_page_size = MAX_PAGE_SIZE
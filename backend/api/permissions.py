@@ -6,7 +6,10 @@ from rest_framework import permissions
 class IsAuthorOrReadOnly(permissions.BasePermission):
     """Allow write access only to the author of the object."""
 
+    _SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
     def has_object_permission(self, request, view, obj):
         """Allow write access only to the author of the object."""
-        return (request.method in permissions.SAFE_METHODS
-                or obj.author == request.user)
+        if request.method in self._SAFE_METHODS:
+            return True
+        return obj.author_id == request.user.id
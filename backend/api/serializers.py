@@ -3,14 +3,12 @@
 from djoser.serializers import UserCreateSerializer, UserSerializer
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
-from rest_framework.validators import UniqueTogetherValidator
 
 from api.constants import MAX_INGREDIENT_AMOUNT, MIN_INGREDIENT_AMOUNT
 from api.fields import Base64ImageField
-from api.utils import create_ingredients
-from recipes.models import (Favorite, Ingredient, Recipe, RecipeIngredient,
-                            ShoppingCart, Tag)
-from users.models import Subscription, User
+from api.utils import create_ingredients, update_ingredients
+from recipes.models import Ingredient, Recipe, RecipeIngredient, Tag
+from users.models import User
 
 
 class UserSignUpSerializer(UserCreateSerializer):
@@ -41,25 +39,25 @@ class UserGetSerializer(UserSerializer):
         )
         read_only_fields = fields
 
-    def to_representation(self, instance):
-        """Convert instance to representation."""
-        ret = super().to_representation(instance)
-        if isinstance(instance, User):
-            ret['is_subscribed'] = self.get_is_subscribed(instance)
-            ret['avatar'] = self.get_avatar(instance)
-        return ret
-
     def get_is_subscribed(self, obj):
         """Get subscription status."""
-        request = self.context.get('request')
-        return (
-            request.user.is_authenticated
-            and request.user.follower.filter(author=obj).exists()
-        )
+        return obj.id in self._get_subscribed_ids()
+
+    def _get_subscribed_ids(self):
+        """Get the cached set of author ids the current user follows."""
+        subscribed_ids = self.context.get('subscribed_ids')
+        if subscribed_ids is None:
+            request = self.context.get('request')
+            subscribed_ids = (
+                set(request.user.follower.values_list('author_id', flat=True))
+                if request and request.user.is_authenticated else set()
+            )
+            self.context['subscribed_ids'] = subscribed_ids
+        return subscribed_ids
 
     def get_avatar(self, obj):
         """Get avatar URL."""
-        if obj.avatar and hasattr(obj.avatar, 'url'):
+        if obj.avatar:
             return self.context['request'].build_absolute_uri(obj.avatar.url)
         return ""
 
@@ -72,6 +70,7 @@ class RecipeSmallSerializer(serializers.ModelSerializer):
 
         model = Recipe
         fields = ('id', 'name', 'image', 'cooking_time')
+        read_only_fields = fields
 
 
 class UserSubscribeRepresentSerializer(UserGetSerializer):
@@ -92,11 +91,13 @@ class UserSubscribeRepresentSerializer(UserGetSerializer):
         recipes_limit = request.query_params.get(
             'recipes_limit') if request else None
         recipes = obj.recipes.all()
+        if 'recipes' not in getattr(obj, '_prefetched_objects_cache', {}):
+            recipes = recipes.order_by('name')
+        recipes = list(recipes)
 
         if recipes_limit:
             try:
-                recipes_limit = int(recipes_limit)
-                recipes = recipes[:recipes_limit]
+                recipes = recipes[:int(recipes_limit)]
             except (ValueError, TypeError):
                 pass
 
@@ -108,40 +109,11 @@ class UserSubscribeRepresentSerializer(UserGetSerializer):
 
     def get_recipes_count(self, obj):
         """Get the count of user's recipes."""
+        if hasattr(obj, 'recipes_count'):
+            return obj.recipes_count
         return obj.recipes.count()
 
 
-class UserSubscribeSerializer(serializers.ModelSerializer):
-    """Serializer for user subscriptions."""
-
-    class Meta:
-        """Meta class for UserSubscribeSerializer."""
-
-        model = Subscription
-        fields = ('author', 'user')
-
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Subscription.objects.all(),
-                fields=('user', 'author'),
-                message='Вы уже подписаны на этого пользователя!'
-            )
-        ]
-
-    def validate(self, data):
-        """Validate subscription data."""
-        if data['user'] == data['author']:
-            raise ValidationError("Вы не можете подписаться на себя!")
-        return data
-
-    def to_representation(self, instance):
-        """Convert instance to representation."""
-        return UserSubscribeRepresentSerializer(
-            instance.author,
-            context={'request': self.context.get('request')}
-        ).data
-
-
 class TagSerializer(serializers.ModelSerializer):
     """Serializer for tags."""
 
@@ -149,7 +121,8 @@ class TagSerializer(serializers.ModelSerializer):
         """Meta class for TagSerializer."""
 
         model = Tag
-        fields = '__all__'
+        fields = ('id', 'name', 'slug')
+        read_only_fields = fields
 
 
 class IngredientSerializer(serializers.ModelSerializer):
@@ -159,7 +132,8 @@ class IngredientSerializer(serializers.ModelSerializer):
         """Meta class for IngredientSerializer."""
 
         model = Ingredient
-        fields = '__all__'
+        fields = ('id', 'name', 'measurement_unit')
+        read_only_fields = fields
 
 
 class IngredientGetSerializer(serializers.ModelSerializer):
@@ -176,12 +150,13 @@ class IngredientGetSerializer(serializers.ModelSerializer):
 
         model = RecipeIngredient
         fields = ('id', 'name', 'measurement_unit', 'amount')
+        read_only_fields = fields
 
 
 class IngredientPostSerializer(serializers.ModelSerializer):
     """Serializer for adding ingredients to recipes."""
 
-    id = serializers.PrimaryKeyRelatedField(queryset=Ingredient.objects.all())
+    id = serializers.IntegerField()
     amount = serializers.IntegerField(
         min_value=MIN_INGREDIENT_AMOUNT,
         max_value=MAX_INGREDIENT_AMOUNT,
@@ -222,19 +197,24 @@ class RecipeGetSerializer(serializers.ModelSerializer):
             'id', 'tags', 'author', 'ingredients', 'is_favorited',
             'is_in_shopping_cart', 'name', 'image', 'text', 'cooking_time'
         )
+        read_only_fields = fields
 
     def get_is_favorited(self, obj):
         """Check if the recipe is favorited by the user."""
+        if hasattr(obj, 'is_favorited'):
+            return obj.is_favorited
         request = self.context.get('request')
-        return (
+        return bool(
             request and request.user.is_authenticated
             and request.user.favorites.filter(recipe=obj).exists()
         )
 
     def get_is_in_shopping_cart(self, obj):
         """Check if the recipe is in the user's shopping cart."""
+        if hasattr(obj, 'is_in_shopping_cart'):
+            return obj.is_in_shopping_cart
         request = self.context.get('request')
-        return (
+        return bool(
             request and request.user.is_authenticated
             and request.user.user_shopping_carts.filter(recipe=obj).exists()
         )
@@ -271,9 +251,22 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
             raise ValidationError(
                 {'ingredients': 'Это поле обязательно.'})
 
-        ingredient_ids = [ingredient['id'] for ingredient in ingredients]
-        if len(set(ingredient_ids)) != len(ingredient_ids):
-            raise ValidationError('Повторяющиеся ингредиенты запрещены.')
+        seen = set()
+        for ingredient in ingredients:
+            if ingredient['id'] in seen:
+                raise ValidationError('Повторяющиеся ингредиенты запрещены.')
+            seen.add(ingredient['id'])
+
+        existing_ids = set(
+            Ingredient.objects.filter(id__in=seen).values_list(
+                'id', flat=True
+            )
+        )
+        missing_ids = seen - existing_ids
+        if missing_ids:
+            raise ValidationError(
+                f'Несуществующие ингредиенты: {sorted(missing_ids)}.'
+            )
 
     def _validate_tags(self, data):
         """Validate tag data."""
@@ -281,9 +274,11 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
         if not tags:
             raise ValidationError({'tags': 'Это поле обязательно.'})
 
-        tag_ids = set(tags)
-        if len(tag_ids) != len(tags):
-            raise ValidationError('Повторяющиеся теги запрещены.')
+        seen = set()
+        for tag in tags:
+            if tag in seen:
+                raise ValidationError('Повторяющиеся теги запрещены.')
+            seen.add(tag)
 
     def create(self, validated_data):
         """Create a new recipe."""
@@ -300,11 +295,8 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
         """Update an existing recipe."""
         ingredients = validated_data.pop('recipeingredients')
         tags = validated_data.pop('tags')
-        instance.tags.clear()
         instance.tags.set(tags)
-        RecipeIngredient.objects.filter(recipe=instance).delete()
-
-        create_ingredients(ingredients, instance)
+        update_ingredients(ingredients, instance)
         return super().update(instance, validated_data)
 
     def to_representation(self, instance):
@@ -313,51 +305,3 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
             instance,
             context={'request': self.context.get('request')}
         ).data
-
-
-class FavoriteSerializer(serializers.ModelSerializer):
-    """Serializer for favorite recipes."""
-
-    class Meta:
-        """Meta class for FavoriteSerializer."""
-
-        model = Favorite
-        fields = ('user', 'recipe')
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Favorite.objects.all(),
-                fields=('user', 'recipe'),
-                message='Этот рецепт уже добавлен в избранное'
-            )
-        ]
-
-    def to_representation(self, instance):
-        """Convert instance to representation."""
-        return RecipeSmallSerializer(
-            instance.recipe,
-            context={'request': self.context.get('request')}
-        ).data
-
-
-class ShoppingCartSerializer(serializers.ModelSerializer):
-    """Serializer for shopping cart."""
-
-    class Meta:
-        """Meta class for ShoppingCartSerializer."""
-
-        model = ShoppingCart
-        fields = ('user', 'recipe')
-        validators = [
-            UniqueTogetherValidator(
-                queryset=ShoppingCart.objects.all(),
-                fields=('user', 'recipe'),
-                message='Этот рецепт уже добавлен в корзину'
-            )
-        ]
-
-    def to_representation(self, instance):
-        """Convert instance to representation."""
-        return RecipeSmallSerializer(
-            instance.recipe,
-            context={'request': self.context.get('request')}
-        ).data
@@ -5,9 +5,10 @@ from rest_framework.routers import DefaultRouter
 
 from api.views import (IngredientViewSet, RecipeShortLinkView, RecipeViewSet,
                        TagViewSet, UserMeView, UserSubscribeView,
-                       UserSubscriptionsViewSet, update_avatar)
+                       UserSubscriptionsViewSet, UserViewSet, update_avatar)
 
 router = DefaultRouter()
+router.register('users', UserViewSet, basename='users')
 router.register('tags', TagViewSet, basename='tags')
 router.register(r'ingredients', IngredientViewSet, basename='ingredients')
 router.register(r'recipes', RecipeViewSet, basename='recipes')
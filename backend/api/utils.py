@@ -3,6 +3,7 @@
 
 from typing import Type
 
+from django.db import IntegrityError
 from django.db.models import Model
 from rest_framework import serializers, status
 from rest_framework.request import Request
@@ -16,45 +17,76 @@ def create_ingredients(ingredients, recipe):
     recipe_ingredients = [
         RecipeIngredient(
             recipe=recipe,
-            ingredient=ingredient['id'],
+            ingredient_id=ingredient['id'],
             amount=ingredient['amount']
         )
         for ingredient in ingredients
     ]
-    RecipeIngredient.objects.bulk_create(recipe_ingredients)
+    RecipeIngredient.objects.bulk_create(recipe_ingredients, batch_size=500)
 
 
-def create_model_instance(
+def update_ingredients(ingredients, recipe):
+    """Sync RecipeIngredient instances with the submitted ingredients."""
+    existing = {
+        recipe_ingredient.ingredient_id: recipe_ingredient
+        for recipe_ingredient in recipe.recipe_ingredients.all()
+    }
+    added = []
+    changed = []
+    incoming_ids = set()
+    for ingredient in ingredients:
+        ingredient_id = ingredient['id']
+        incoming_ids.add(ingredient_id)
+        current = existing.get(ingredient_id)
+        if current is None:
+            added.append(ingredient)
+        elif current.amount != ingredient['amount']:
+            current.amount = ingredient['amount']
+            changed.append(current)
+    removed_ids = set(existing) - incoming_ids
+    if removed_ids:
+        recipe.recipe_ingredients.filter(
+            ingredient_id__in=removed_ids
+        ).delete()
+    if changed:
+        RecipeIngredient.objects.bulk_update(changed, ['amount'])
+    if added:
+        create_ingredients(added, recipe)
+
 
+def create_model_instance(
     request: Request,
     instance: Model,
-    serializer_class: Type[serializers.ModelSerializer]
+    model_class: Type[Model],
+    serializer_class: Type[serializers.ModelSerializer],
+    error_message: str
 ) -> Response:
     """Create a model instance."""
-    serializer = serializer_class(
-        data={'user': request.user.id, 'recipe': instance.id},
-        context={'request': request}
-    )
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
+    try:
+        model_class.objects.create(user=request.user, recipe=instance)
+    except IntegrityError:
+        return Response(
+            {'errors': error_message},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    serializer = serializer_class(instance, context={'request': request})
     return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 def delete_model_instance(
     request: Request,
     model_class: Type[Model],
-    instance: Model,
+    recipe_id: int,
     error_message: str
 ) -> Response:
     """Delete a model instance."""
-    if not model_class.objects.filter(
+    deleted, _ = model_class.objects.filter(
         user=request.user,
-        recipe=instance
-    ).exists():
+        recipe_id=recipe_id
+    ).delete()
+    if not deleted:
         return Response(
             {'errors': error_message},
             status=status.HTTP_400_BAD_REQUEST
         )
-
-    model_class.objects.filter(user=request.user, recipe=instance).delete()
     return Response(status=status.HTTP_204_NO_CONTENT)
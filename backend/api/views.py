@@ -1,12 +1,16 @@
 """Views for the API application."""
 
-import base64
+import binascii
 
 import short_url
 from django.core.files.base import ContentFile
-from django.db.models import Sum
-from django.http import HttpResponse, JsonResponse
+from djoser.views import UserViewSet as DjoserUserViewSet
+from django.db import IntegrityError
+from django.db.models import Count, Exists, OuterRef, Prefetch, Sum
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
@@ -16,19 +20,21 @@ from rest_framework.permissions import (SAFE_METHODS, AllowAny,
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from api.constants import MAX_IMAGE_UPLOAD_SIZE, REFERENCE_CACHE_TIMEOUT
+from api.fields import DATA_URI_PATTERN
 from api.filters import IngredientFilter, RecipeFilter
 from api.permissions import IsAuthorOrReadOnly
-from api.serializers import (FavoriteSerializer, IngredientSerializer,
-                             RecipeCreateSerializer, RecipeGetSerializer,
-                             ShoppingCartSerializer, TagSerializer,
-                             UserGetSerializer,
-                             UserSubscribeRepresentSerializer,
-                             UserSubscribeSerializer)
+from api.serializers import (IngredientSerializer, RecipeCreateSerializer,
+                             RecipeGetSerializer, RecipeSmallSerializer,
+                             TagSerializer, UserGetSerializer,
+                             UserSubscribeRepresentSerializer)
 from api.utils import create_model_instance, delete_model_instance
 from recipes.models import (Favorite, Ingredient, Recipe, RecipeIngredient,
                             ShoppingCart, Tag)
 from users.models import Subscription, User
 
+SHORT_LINK_ENCODER = short_url.UrlEncoder()
+
 
 @api_view(['PUT', 'DELETE'])
 @permission_classes([IsAuthenticated])
@@ -38,14 +44,27 @@ def update_avatar(request):
 
     if request.method == 'PUT':
         avatar_data = request.data.get('avatar')
-        if avatar_data and avatar_data.startswith('data:image'):
-            format_data, imgstr = avatar_data.split(';base64,')
-            ext = format_data.split('/')[-1]
-            avatar = ContentFile(
-                base64.b64decode(imgstr),
-                name=f'{user.username}_avatar.{ext}'
+        match = (
+            DATA_URI_PATTERN.match(avatar_data)
+            if isinstance(avatar_data, str) else None
+        )
+        if match:
+            imgstr = avatar_data[match.end():]
+            if len(imgstr) * 3 // 4 > MAX_IMAGE_UPLOAD_SIZE:
+                return JsonResponse(
+                    {'error': 'Изображение слишком большое'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            try:
+                decoded = binascii.a2b_base64(imgstr)
+            except binascii.Error:
+                return JsonResponse(
+                    {'error': 'Некорректные данные изображения'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            user.avatar = ContentFile(
+                decoded, name=f'{user.username}_avatar.{match["ext"]}'
             )
-            user.avatar = avatar
             user.save()
             return JsonResponse(
                 {'avatar': request.build_absolute_uri(user.avatar.url)},
@@ -62,6 +81,14 @@ def update_avatar(request):
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class UserViewSet(DjoserUserViewSet):
+    """Users endpoint with explicit ordering for stable pagination."""
+
+    def get_queryset(self):
+        """Get the user queryset ordered by username."""
+        return super().get_queryset().order_by('username')
+
+
 class UserMeView(APIView):
     """View for getting the current user's information."""
 
@@ -83,26 +110,35 @@ class UserSubscribeView(APIView):
     def post(self, request, user_id):
         """Handle POST request to create a subscription."""
         author = get_object_or_404(User, id=user_id)
-        serializer = UserSubscribeSerializer(
-            data={'user': request.user.id, 'author': author.id},
-            context={'request': request}
+        if author == request.user:
+            return Response(
+                {'errors': 'Вы не можете подписаться на себя!'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            Subscription.objects.create(user=request.user, author=author)
+        except IntegrityError:
+            return Response(
+                {'errors': 'Вы уже подписаны на этого пользователя!'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer = UserSubscribeRepresentSerializer(
+            author, context={'request': request}
         )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def delete(self, request, user_id):
         """Handle DELETE request to remove a subscription."""
-        author = get_object_or_404(User, id=user_id)
-        subscription = Subscription.objects.filter(
-            user=request.user, author=author
-        )
-        if not subscription.exists():
+        if not User.objects.filter(id=user_id).exists():
+            raise Http404
+        deleted, _ = Subscription.objects.filter(
+            user=request.user, author_id=user_id
+        ).delete()
+        if not deleted:
             return Response(
                 {'errors': 'Вы не подписаны на этого пользователя'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        subscription.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -114,7 +150,7 @@ class RecipeShortLinkView(APIView):
     def get(self, request, pk):
         """Handle GET request to generate a short link."""
         recipe = get_object_or_404(Recipe, pk=pk)
-        short_link = short_url.encode(recipe.id)
+        short_link = SHORT_LINK_ENCODER.encode_url(recipe.id)
         base_url = request.build_absolute_uri('/')
         full_short_link = f"{base_url}recipes/{short_link}/"
         return Response(
@@ -131,22 +167,35 @@ class UserSubscriptionsViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
 
     def get_queryset(self):
         """Get the queryset for user subscriptions."""
-        return User.objects.filter(following__user=self.request.user)
+        return User.objects.filter(
+            following__user=self.request.user
+        ).prefetch_related(
+            Prefetch(
+                'recipes',
+                queryset=Recipe.objects.only(
+                    'id', 'name', 'image', 'cooking_time', 'author_id'
+                ).order_by('name')
+            )
+        ).annotate(recipes_count=Count('recipes')).order_by('username')
 
 
+@method_decorator(cache_page(REFERENCE_CACHE_TIMEOUT), name='list')
+@method_decorator(cache_page(REFERENCE_CACHE_TIMEOUT), name='retrieve')
 class TagViewSet(viewsets.ReadOnlyModelViewSet):
     """Get information about tags."""
 
-    queryset = Tag.objects.all()
+    queryset = Tag.objects.order_by('name')
     serializer_class = TagSerializer
     permission_classes = (AllowAny,)
     pagination_class = None
 
 
+@method_decorator(cache_page(REFERENCE_CACHE_TIMEOUT), name='list')
+@method_decorator(cache_page(REFERENCE_CACHE_TIMEOUT), name='retrieve')
 class IngredientViewSet(viewsets.ReadOnlyModelViewSet):
     """Get information about ingredients."""
 
-    queryset = Ingredient.objects.all()
+    queryset = Ingredient.objects.order_by('name')
     serializer_class = IngredientSerializer
     permission_classes = (AllowAny,)
     filter_backends = (DjangoFilterBackend,)
@@ -157,12 +206,34 @@ class IngredientViewSet(viewsets.ReadOnlyModelViewSet):
 class RecipeViewSet(viewsets.ModelViewSet):
     """ViewSet for working with recipes."""
 
-    queryset = Recipe.objects.all()
     permission_classes = (IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = RecipeFilter
     http_method_names = ['get', 'post', 'patch', 'delete']
 
+    def get_queryset(self):
+        """Get the recipe queryset with per-user flags annotated."""
+        queryset = Recipe.objects.select_related('author').prefetch_related(
+            'tags',
+            Prefetch(
+                'recipe_ingredients',
+                queryset=RecipeIngredient.objects.select_related('ingredient')
+            )
+        ).order_by('name')
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                is_favorited=Exists(
+                    Favorite.objects.filter(user=user, recipe=OuterRef('pk'))
+                ),
+                is_in_shopping_cart=Exists(
+                    ShoppingCart.objects.filter(
+                        user=user, recipe=OuterRef('pk')
+                    )
+                )
+            )
+        return queryset
+
     def get_serializer_class(self):
         """Get the appropriate serializer class."""
         if self.request.method in SAFE_METHODS:
@@ -176,13 +247,21 @@ class RecipeViewSet(viewsets.ModelViewSet):
     )
     def favorite(self, request, pk):
         """Add/remove recipe to/from favorites."""
-        recipe = get_object_or_404(Recipe, id=pk)
         if request.method == 'POST':
-            return create_model_instance(request, recipe, FavoriteSerializer)
+            recipe = get_object_or_404(Recipe, id=pk)
+            return create_model_instance(
+                request,
+                recipe,
+                Favorite,
+                RecipeSmallSerializer,
+                'Этот рецепт уже добавлен в избранное'
+            )
+        if not Recipe.objects.filter(id=pk).exists():
+            raise Http404
         return delete_model_instance(
             request,
             Favorite,
-            recipe,
+            pk,
             'Этот рецепт не добавлен в избранное'
         )
 
@@ -193,17 +272,21 @@ class RecipeViewSet(viewsets.ModelViewSet):
     )
     def shopping_cart(self, request, pk):
         """Add/remove recipe to/from shopping cart."""
-        recipe = get_object_or_404(Recipe, id=pk)
         if request.method == 'POST':
+            recipe = get_object_or_404(Recipe, id=pk)
             return create_model_instance(
                 request,
                 recipe,
-                ShoppingCartSerializer
+                ShoppingCart,
+                RecipeSmallSerializer,
+                'Этот рецепт уже добавлен в корзину'
             )
+        if not Recipe.objects.filter(id=pk).exists():
+            raise Http404
         return delete_model_instance(
             request,
             ShoppingCart,
-            recipe,
+            pk,
             'Этот рецепт не добавлен в корзину'
         )
 
@@ -215,21 +298,22 @@ class RecipeViewSet(viewsets.ModelViewSet):
     def get_shopping_cart_ingredients(self, user):
         """Get aggregated ingredients for user's shopping cart."""
         return RecipeIngredient.objects.filter(
-            recipe__in=ShoppingCart.objects.filter(user=user).values('recipe')
+            recipe__recipe_shopping_carts__user=user
         ).values(
             'ingredient__name', 'ingredient__measurement_unit'
-        ).annotate(ingredient_amount=Sum('amount'))
-
-    def format_shopping_list(self, ingredients):
-        """Format the shopping list as a string."""
-        shopping_list = ['Shopping List:\n']
-        shopping_list.extend(
-            f'\n{ingredient["ingredient__name"]} - '
-            f'{ingredient["ingredient_amount"]}, '
-            f'{ingredient["ingredient__measurement_unit"]}'
-            for ingredient in ingredients
-        )
-        return '\n'.join(shopping_list)
+        ).annotate(
+            ingredient_amount=Sum('amount')
+        ).order_by('ingredient__name')
+
+    def stream_shopping_list(self, ingredients):
+        """Yield the shopping list as text chunks."""
+        yield 'Shopping List:\n'
+        for ingredient in ingredients.iterator(chunk_size=500):
+            yield (
+                f'\n\n{ingredient["ingredient__name"]} - '
+                f'{ingredient["ingredient_amount"]}, '
+                f'{ingredient["ingredient__measurement_unit"]}'
+            )
 
     @action(
         detail=False,
@@ -239,8 +323,9 @@ class RecipeViewSet(viewsets.ModelViewSet):
     def download_shopping_cart(self, request):
         """Send a file with a shopping list."""
         ingredients = self.get_shopping_cart_ingredients(request.user)
-        shopping_list = self.format_shopping_list(ingredients)
-
-        response = HttpResponse(shopping_list, content_type='text/plain')
+        response = StreamingHttpResponse(
+            self.stream_shopping_list(ingredients),
+            content_type='text/plain'
+        )
         response['Content-Disposition'] = 'attachment; filename="shopping.txt"'
         return response
@@ -1,6 +1,7 @@
 """Recipes admin."""
 
 from django.contrib import admin
+from django.db.models import Count
 
 from .models import (Favorite, Ingredient, Recipe, RecipeIngredient,
                      ShoppingCart, Tag)
@@ -23,13 +24,19 @@ class RecipeAdmin(admin.ModelAdmin):
     search_fields = ('name', 'author__username', 'ingredients__name')
     inlines = (RecipeIngredientInline,)
 
+    def get_queryset(self, request):
+        """Annotate the favorites count for the changelist."""
+        return super().get_queryset(request).annotate(
+            favorite_count=Count('favorites', distinct=True)
+        )
+
     @admin.display(
         description='Number of adds to favorites',
-        ordering='favorites__count'
+        ordering='favorite_count'
     )
     def favorite_count(self, obj):
         """Get the count of user's favorites."""
-        return obj.favorites.count()
+        return obj.favorite_count
 
 
 @admin.register(Tag)
@@ -5,6 +5,7 @@ import os
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from recipes.models import Ingredient
 
@@ -25,8 +26,15 @@ class Command(BaseCommand):
         """Import ingredients from JSON file."""
         with open(filename, 'r', encoding='utf-8') as file:
             data = json.load(file)
-            for item in data:
-                Ingredient.objects.get_or_create(
-                    name=item['name'],
-                    measurement_unit=item['measurement_unit']
-                )
+        with transaction.atomic():
+            Ingredient.objects.bulk_create(
+                (
+                    Ingredient(
+                        name=item['name'],
+                        measurement_unit=item['measurement_unit']
+                    )
+                    for item in data
+                ),
+                batch_size=1000,
+                ignore_conflicts=True
+            )
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+INDEX_NAME = 'ingredient_name_upper_idx'
+
+
+def create_index(apps, schema_editor):
+    """Create a functional index on UPPER(name) for istartswith search."""
+    table = apps.get_model('recipes', 'Ingredient')._meta.db_table
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} '
+            f'ON {table} (UPPER(name) varchar_pattern_ops)'
+        )
+    else:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON {table} (UPPER(name))'
+        )
+
+
+def drop_index(apps, schema_editor):
+    """Drop the functional index on UPPER(name)."""
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
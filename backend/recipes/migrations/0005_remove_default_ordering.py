@@ -0,0 +1,53 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0004_remove_recipe_shopping_carts'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='favorite',
+            options={
+                'verbose_name': 'Избранный рецепт',
+                'verbose_name_plural': 'Избранные рецепты',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='ingredient',
+            options={
+                'verbose_name': 'Ингредиент',
+                'verbose_name_plural': 'Ингредиенты',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='recipe',
+            options={
+                'verbose_name': 'Рецепт',
+                'verbose_name_plural': 'Рецепты',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='recipeingredient',
+            options={
+                'verbose_name': 'Рецепт - ингредиент',
+                'verbose_name_plural': 'Рецепты - ингредиенты',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='shoppingcart',
+            options={
+                'verbose_name': 'Корзина покупок',
+                'verbose_name_plural': 'Корзина покупок',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='tag',
+            options={
+                'verbose_name': 'Тег',
+                'verbose_name_plural': 'Теги',
+            },
+        ),
+    ]
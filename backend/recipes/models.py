@@ -44,18 +44,12 @@ class Recipe(models.Model):
         related_name='recipes',
         verbose_name="Теги"
     )
-    shopping_carts = models.ManyToManyField(
-        'ShoppingCart',
-        related_name='recipes',
-        blank=True
-    )
 
     class Meta:
         """Meta class for Recipe."""
 
         verbose_name = "Рецепт"
         verbose_name_plural = "Рецепты"
-        ordering = ['name']
 
     def __str__(self):
         """Return name."""
@@ -75,7 +69,6 @@ class Tag(models.Model):
 
         verbose_name = "Тег"
         verbose_name_plural = "Теги"
-        ordering = ['name']
 
     def __str__(self):
         """Return name."""
@@ -104,7 +97,6 @@ class Ingredient(models.Model):
                 fields=['name', 'measurement_unit'], name='unique_ingredient'
             )
         ]
-        ordering = ['name']
 
     def __str__(self):
         """Return name and measurement unit."""
@@ -139,7 +131,6 @@ class RecipeIngredient(models.Model):
                 name='unique_recipe_ingredient'
             )
         ]
-        ordering = ['recipe']
 
     def __str__(self):
         """Return recipe and ingredient."""
@@ -175,7 +166,6 @@ class Favorite(models.Model):
                 fields=['user', 'recipe'], name='unique_favorite'
             )
         ]
-        ordering = ['recipe__name']
 
     def __str__(self):
         """Return user and recipe."""
@@ -208,7 +198,6 @@ class ShoppingCart(models.Model):
                 fields=['user', 'recipe'], name='unique_shopping_cart'
             )
         ]
-        ordering = ['recipe__name']
 
     def __str__(self):
         """Return user and recipe."""
@@ -2,6 +2,7 @@
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import Count
 
 from .models import Subscription, User
 
@@ -23,21 +24,28 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ('is_staff', 'is_superuser', 'is_active')
     search_fields = ('username', 'email', 'first_name', 'last_name')
 
+    def get_queryset(self, request):
+        """Annotate recipe and subscriber counts for the changelist."""
+        return super().get_queryset(request).annotate(
+            recipe_count=Count('recipes', distinct=True),
+            subscriber_count=Count('following', distinct=True)
+        )
+
     @admin.display(
         description='Recipe count',
-        ordering='recipes__count'
+        ordering='recipe_count'
     )
     def recipe_count(self, obj):
         """Get the count of user's recipes."""
-        return obj.recipes.count()
+        return obj.recipe_count
 
     @admin.display(
         description='Subscriber count',
-        ordering='subscribers__count'
+        ordering='subscriber_count'
     )
     def subscriber_count(self, obj):
         """Get the count of user's subscribers."""
-        return obj.subscribers.count()
+        return obj.subscriber_count
 
 
 @admin.register(Subscription)
@@ -45,4 +53,5 @@ class SubscriptionAdmin(admin.ModelAdmin):
     """Subscription model admin."""
 
     list_display = ('pk', 'user', 'author')
+    list_select_related = ('user', 'author')
     search_fields = ('user__username', 'author__username')
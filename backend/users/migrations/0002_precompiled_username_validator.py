@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+import users.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='username',
+            field=models.CharField(
+                max_length=150,
+                unique=True,
+                validators=[
+                    users.validators.username_regex_validator,
+                    users.validators.validate_username_not_me,
+                ],
+                verbose_name='Никнейм',
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+import users.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_precompiled_username_validator'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='username',
+            field=models.CharField(
+                max_length=150,
+                unique=True,
+                validators=[users.validators.validate_username],
+                verbose_name='Никнейм',
+            ),
+        ),
+    ]
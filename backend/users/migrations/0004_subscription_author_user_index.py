@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_fused_username_validator'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(
+                fields=['author', 'user'],
+                name='sub_author_user_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_subscription_author_user_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='user',
+            options={
+                'verbose_name': 'Пользователь',
+                'verbose_name_plural': 'Пользователи',
+            },
+        ),
+    ]
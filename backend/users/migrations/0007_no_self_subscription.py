@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_remove_user_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='subscription',
+            constraint=models.CheckConstraint(
+                check=~models.Q(user=models.F('author')),
+                name='no_self_subscription'
+            ),
+        ),
+    ]
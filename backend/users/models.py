@@ -2,10 +2,13 @@
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.translation import gettext_lazy as _
 
 from users.constants import (DEFAULT_EMAIL_MAX_LENGTH, FIRST_NAME_MAX_LENGTH,
                              LAST_NAME_MAX_LENGTH, USERNAME_MAX_LENGTH)
-from users.validators import username_regex_validator, validate_username_not_me
+from users.validators import validate_username
+
+USERNAME_VALIDATORS = (validate_username,)
 
 
 class User(AbstractUser):
@@ -17,44 +20,48 @@ class User(AbstractUser):
     email = models.EmailField(
         max_length=DEFAULT_EMAIL_MAX_LENGTH,
         unique=True,
-        verbose_name="адрес электронной почты"
+        verbose_name=_("адрес электронной почты")
     )
     username = models.CharField(
         max_length=USERNAME_MAX_LENGTH,
         unique=True,
-        verbose_name="Никнейм",
-        validators=[
-            username_regex_validator,
-            validate_username_not_me
-        ]
+        verbose_name=_("Никнейм"),
+        validators=USERNAME_VALIDATORS
     )
     first_name = models.CharField(
         max_length=FIRST_NAME_MAX_LENGTH,
-        verbose_name="Имя"
+        verbose_name=_("Имя")
     )
     last_name = models.CharField(
         max_length=LAST_NAME_MAX_LENGTH,
-        verbose_name="Фамилия"
+        verbose_name=_("Фамилия")
     )
     avatar = models.ImageField(
         upload_to='avatars/',
         blank=True,
         null=True,
-        verbose_name="Аватар"
+        verbose_name=_("Аватар")
     )
 
     class Meta:
         """Meta class for User."""
 
-        verbose_name = "Пользователь"
-        verbose_name_plural = "Пользователи"
-        ordering = ['username']
+        verbose_name = _("Пользователь")
+        verbose_name_plural = _("Пользователи")
 
     def __str__(self):
         """Return username."""
         return self.username
 
 
+class SubscriptionQuerySet(models.QuerySet):
+    """Queryset helpers for subscriptions."""
+
+    def with_users(self):
+        """Join both related users to avoid per-row lookups."""
+        return self.select_related('user', 'author')
+
+
 class Subscription(models.Model):
     """User subscription model."""
 
@@ -62,27 +69,39 @@ class Subscription(models.Model):
         User,
         on_delete=models.CASCADE,
         related_name='follower',
-        verbose_name='Подписчик'
+        verbose_name=_('Подписчик')
     )
     author = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         related_name='following',
-        verbose_name='Автор'
+        verbose_name=_('Автор')
     )
 
+    objects = SubscriptionQuerySet.as_manager()
+
     class Meta:
         """Meta class for Subscription."""
 
-        verbose_name = 'Подписка'
-        verbose_name_plural = 'Подписки'
+        verbose_name = _('Подписка')
+        verbose_name_plural = _('Подписки')
+        indexes = [
+            models.Index(
+                fields=['author', 'user'],
+                name='sub_author_user_idx'
+            )
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['user', 'author'],
                 name='unique_subscription'
+            ),
+            models.CheckConstraint(
+                check=~models.Q(user=models.F('author')),
+                name='no_self_subscription'
             )
         ]
 
     def __str__(self):
-        """Return subscription string."""
-        return f'{self.user.username} подписан на {self.author.username}'
+        """Return subscription string without dereferencing the FKs."""
+        return f'Пользователь {self.user_id} подписан на {self.author_id}'
@@ -1,13 +1,35 @@
+import re
+
 from django.core.exceptions import ValidationError
-from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
 from users.constants import FORBIDDEN_USERNAME
 
-username_regex_validator = RegexValidator(
-    regex=r'^[\w.@+-]+$',
-    message=_("Никнейм может содержать только буквы, цифры и @/./+/-/_.")
-)
+USERNAME_PATTERN = re.compile(r'[\w.@+-]+\Z')
+FORBIDDEN_USERNAMES = frozenset({FORBIDDEN_USERNAME.casefold()})
+
+
+def validate_username(value):
+    """Validate forbidden names and allowed characters in one pass."""
+    if value.casefold() in FORBIDDEN_USERNAMES:
+        raise ValidationError(
+            _(f'Никнейм не может быть "{FORBIDDEN_USERNAME}".'),
+            params={'value': value},
+        )
+    if not USERNAME_PATTERN.fullmatch(value):
+        raise ValidationError(
+            _("Никнейм может содержать только буквы, цифры и @/./+/-/_."),
+            params={'value': value},
+        )
+
+
+def username_regex_validator(value):
+    """Validate that the username contains only allowed characters."""
+    if not USERNAME_PATTERN.fullmatch(value):
+        raise ValidationError(
+            _("Никнейм может содержать только буквы, цифры и @/./+/-/_."),
+            params={'value': value},
+        )
 
 
 def validate_username_not_me(value):